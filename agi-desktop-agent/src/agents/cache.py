@@ -0,0 +1,57 @@
+"""
+In-process TTL cache for agent results
+Developer 1: Backend Agents
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    def __init__(self, maxsize=1024, ttl=3600):
+        """
+        Bounded LRU cache whose entries expire after ttl seconds
+        
+        Args:
+            maxsize: Maximum number of entries kept; least recently used go first
+            ttl: Seconds an entry stays valid (0 disables the cache)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        if not self.ttl:
+            return None
+        
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        """Store value under key, evicting the oldest entry when full"""
+        if not self.ttl:
+            return
+        
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._data.clear()
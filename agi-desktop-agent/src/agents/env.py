@@ -0,0 +1,20 @@
+"""
+Shared environment configuration for the agent modules
+Developer 1: Backend Agents
+"""
+
+import os
+from dotenv import load_dotenv
+
+# agi-desktop-agent/ (three levels up from src/agents/env.py)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ENV_PATH = os.path.join(PROJECT_ROOT, 'config', '.env')
+
+_loaded = False
+
+def load_env():
+    """Load config/.env into os.environ, parsing the file at most once per process"""
+    global _loaded
+    if not _loaded:
+        load_dotenv(ENV_PATH)
+        _loaded = True
@@ -4,16 +4,49 @@ Developer 1: Backend Agents
 """
 
 import os
-from groq import Groq
-from dotenv import load_dotenv
+import threading
+from groq import Groq, AsyncGroq
 
-load_dotenv('config/.env')
+from .env import load_env
+
+load_env()
 
 class GroqClient:
-    def __init__(self):
+    def __init__(self, http_client=None):
+        """
+        Args:
+            http_client: Optional shared httpx.Client so several clients reuse
+                one keep-alive connection pool
+        """
         self.api_key = os.getenv('GROQ_API_KEY')
         self.model = os.getenv('GROQ_MODEL', 'llama-3.3-70b-versatile')
-        self.client = Groq(api_key=self.api_key)
+        self.client = Groq(api_key=self.api_key, http_client=http_client)
+        # A caller-supplied pool belongs to the caller; only close our own
+        self._owns_http_client = http_client is None
+        self._async_client = None
+        self._async_lock = threading.Lock()
+    
+    @property
+    def async_client(self):
+        # Built on first achat() so sync-only callers never open an async pool
+        if self._async_client is None:
+            with self._async_lock:
+                if self._async_client is None:
+                    self._async_client = AsyncGroq(api_key=self.api_key)
+        return self._async_client
+    
+    def close(self):
+        """Close the sync connection pool if this client created it"""
+        if self._owns_http_client:
+            self.client.close()
+    
+    async def aclose(self):
+        """Close the async connection pool (if built) and the sync one"""
+        with self._async_lock:
+            async_client, self._async_client = self._async_client, None
+        if async_client is not None:
+            await async_client.close()
+        self.close()
     
     def chat(self, messages, tools=None, temperature=0.7):
         """
@@ -28,36 +61,93 @@ class GroqClient:
             Response dict with content and optional tool_calls
         """
         try:
-            params = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": temperature,
-                "max_tokens": int(os.getenv('MAX_TOKENS', 4096))
-            }
-            
-            if tools:
-                params["tools"] = tools
-                params["tool_choice"] = "auto"
-            
+            params = self._build_params(messages, tools, temperature)
             response = self.client.chat.completions.create(**params)
-            
-            return {
-                "content": response.choices[0].message.content,
-                "tool_calls": response.choices[0].message.tool_calls if hasattr(response.choices[0].message, 'tool_calls') else None,
-                "finish_reason": response.choices[0].finish_reason
-            }
+            return self._to_result(response)
         
         except Exception as e:
             print(f"Groq API Error: {e}")
             return {"content": None, "error": str(e)}
     
+    async def achat(self, messages, tools=None, temperature=0.7):
+        """
+        Async version of chat() so several requests can share one event loop
+        
+        Args:
+            messages: List of message dicts [{"role": "user", "content": "..."}]
+            tools: Optional list of tool definitions for function calling
+            temperature: Model temperature (0-1)
+        
+        Returns:
+            Response dict with content and optional tool_calls
+        """
+        try:
+            params = self._build_params(messages, tools, temperature)
+            response = await self.async_client.chat.completions.create(**params)
+            return self._to_result(response)
+        
+        except Exception as e:
+            print(f"Groq API Error: {e}")
+            return {"content": None, "error": str(e)}
+    
+    def chat_stream(self, messages, temperature=0.7):
+        """
+        Stream a chat completion from Groq, yielding text as it arrives
+        
+        Args:
+            messages: List of message dicts [{"role": "user", "content": "..."}]
+            temperature: Model temperature (0-1)
+        
+        Yields:
+            Content deltas (str) in generation order
+        
+        Raises:
+            Any Groq API or connection error, including one raised after
+            some deltas were already yielded, so a dropped stream is never
+            mistaken for a finished answer
+        """
+        params = self._build_params(messages, None, temperature)
+        params["stream"] = True
+        
+        for chunk in self.client.chat.completions.create(**params):
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+    
+    def _build_params(self, messages, tools, temperature):
+        """Build the request parameters shared by chat, achat and chat_stream"""
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": int(os.getenv('MAX_TOKENS', 4096))
+        }
+        
+        if tools:
+            params["tools"] = tools
+            params["tool_choice"] = "auto"
+        
+        return params
+    
+    @staticmethod
+    def _to_result(response):
+        """Convert a completion into the response dict returned by chat and achat"""
+        message = response.choices[0].message
+        return {
+            "content": message.content,
+            "tool_calls": message.tool_calls if hasattr(message, 'tool_calls') else None,
+            "finish_reason": response.choices[0].finish_reason
+        }
+    
     def test_connection(self):
         """Test if Groq API is working"""
         test_response = self.chat([{"role": "user", "content": "Hello, respond with 'OK'"}])
         return "OK" in (test_response.get("content") or "")
 
 
-# Quick test
+# Quick test (run with: python -m src.agents.groq_client)
 if __name__ == "__main__":
     client = GroqClient()
     if client.test_connection():
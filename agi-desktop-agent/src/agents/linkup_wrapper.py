@@ -3,11 +3,15 @@ Linkup Search API Wrapper
 Developer 1: Backend Agents
 """
 
+import copy
 import os
+from concurrent.futures import ThreadPoolExecutor
 from linkup import LinkupClient
-from dotenv import load_dotenv
 
-load_dotenv('config/.env')
+from .cache import TTLCache
+from .env import load_env
+
+load_env()
 
 class LinkupWrapper:
     def __init__(self):
@@ -15,6 +19,9 @@ class LinkupWrapper:
         self.client = LinkupClient(api_key=self.api_key)
         self.depth = os.getenv('LINKUP_DEPTH', 'standard')
         self.output_type = os.getenv('LINKUP_OUTPUT_TYPE', 'searchResults')
+        # Per-source snippet length; the single bound on source text size
+        self.snippet_chars = int(os.getenv('LINKUP_SNIPPET_CHARS', 200))
+        self._cache = TTLCache(maxsize=128, ttl=int(os.getenv('LINKUP_CACHE_TTL', 60)))
     
     def search(self, query, max_results=5):
         """
@@ -26,7 +33,15 @@ class LinkupWrapper:
         
         Returns:
             dict with sources, snippets, and URLs
+        
+        Repeated (query, max_results) lookups within LINKUP_CACHE_TTL seconds
+        are answered from memory without another API call.
         """
+        cache_key = (query, max_results)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         try:
             # TODO: Implement actual Linkup search
             # This is a starter template - implement based on Linkup SDK docs
@@ -36,21 +51,31 @@ class LinkupWrapper:
                 output_type=self.output_type
             )
             
-            # Parse and format results
+            # Parse and format results, skipping duplicate URLs in one pass
             formatted_sources = []
-            for i, result in enumerate(results[:max_results]):
+            seen = set()
+            for result in results:
+                if len(formatted_sources) >= max_results:
+                    break
+                key = result.get("url") or result.get("title")
+                if key:
+                    if key in seen:
+                        continue
+                    seen.add(key)
                 formatted_sources.append({
                     "title": result.get("title", ""),
                     "url": result.get("url", ""),
-                    "snippet": result.get("content", "")[:200],  # First 200 chars
-                    "relevance": i + 1
+                    "snippet": result.get("content", "")[:self.snippet_chars],
+                    "relevance": len(formatted_sources) + 1
                 })
             
-            return {
+            response = {
                 "query": query,
                 "sources": formatted_sources,
                 "total_found": len(results)
             }
+            self._cache.set(cache_key, copy.deepcopy(response))
+            return response
         
         except Exception as e:
             print(f"Linkup Search Error: {e}")
@@ -60,10 +85,42 @@ class LinkupWrapper:
                 "error": str(e)
             }
     
-    def format_sources_for_agent(self, sources):
-        """Format Linkup sources into text for LLM context"""
+    def clear_cache(self):
+        """Forget cached search results, e.g. on an explicit user refresh"""
+        self._cache.clear()
+    
+    def search_many(self, queries, max_results=5, max_concurrency=8):
+        """
+        Run several Linkup searches concurrently
+        
+        Each search is a blocking HTTP call, so they run in a thread pool and
+        total latency is roughly the slowest query instead of the sum.
+        
+        Args:
+            queries: List of search query strings
+            max_results: Maximum number of results per query
+            max_concurrency: Maximum number of searches in flight at once
+        
+        Returns:
+            dict mapping each query to its search() result, in input order
+        """
+        if not queries:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(queries))) as executor:
+            results = executor.map(lambda q: self.search(q, max_results=max_results), queries)
+            return dict(zip(queries, results))
+    
+    def format_sources_for_agent(self, sources, max_sources=5):
+        """
+        Format Linkup sources into text for LLM context
+        
+        Only the first max_sources sources are kept. Snippets are already
+        cut to LINKUP_SNIPPET_CHARS by search(), so the prompt size stays
+        bounded no matter how long the fetched articles are.
+        """
         formatted = []
-        for i, source in enumerate(sources, 1):
+        for i, source in enumerate(sources[:max_sources], 1):
             formatted.append(
                 f"Source {i}: {source['title']}\n"
                 f"URL: {source['url']}\n"
@@ -77,7 +134,7 @@ class LinkupWrapper:
         return len(test_result.get("sources", [])) > 0 or "error" not in test_result
 
 
-# Quick test
+# Quick test (run with: python -m src.agents.linkup_wrapper)
 if __name__ == "__main__":
     linkup = LinkupWrapper()
     if linkup.test_connection():
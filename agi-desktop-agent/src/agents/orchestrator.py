@@ -5,6 +5,17 @@ Developer 1: Backend Agents
 This is the integration point for the UI layer.
 """
 
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+
+import httpx
+
+from .cache import TTLCache
 from .groq_client import GroqClient
 from .linkup_wrapper import LinkupWrapper
 # TODO: Import specific agents as you build them
@@ -14,20 +25,95 @@ from .linkup_wrapper import LinkupWrapper
 
 class AgentOrchestrator:
     def __init__(self):
-        self.groq = GroqClient()
-        self.linkup = LinkupWrapper()
-        # TODO: Initialize specific agents
-        # self.email_agent = EmailAgent(self.groq, self.linkup)
-        # self.document_agent = DocumentAgent(self.groq, self.linkup)
-        # self.meeting_agent = MeetingAgent(self.groq, self.linkup)
-    
-    def process(self, scenario: str, input_data: dict) -> dict:
+        self._cache = TTLCache(maxsize=1024, ttl=int(os.getenv('AGI_CACHE_TTL', 3600)))
+        # Scenario name -> handler; register new scenarios here
+        self._handlers = {
+            "email": self._process_email,
+            "document": self._process_document,
+            "meeting": self._process_meeting,
+        }
+        # Clients and agents are built on first use, so callers only pay for
+        # the scenarios they actually run. aprocess() runs process() in worker
+        # threads, so construction is guarded by a (reentrant) lock.
+        self._init_lock = threading.RLock()
+        self._http = None
+        self._groq = None
+        self._linkup = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    def close(self):
+        """
+        Close the Groq client and the shared HTTP pool; clients are rebuilt
+        on next use. Callers that used aprocess()/achat() should prefer
+        aclose(), which also closes the async Groq pool.
+        """
+        with self._init_lock:
+            groq, self._groq = self._groq, None
+            http, self._http = self._http, None
+        if groq is not None:
+            groq.close()
+        if http is not None:
+            http.close()
+    
+    async def aclose(self):
+        """Async close(): also closes the Groq client's async pool"""
+        with self._init_lock:
+            groq, self._groq = self._groq, None
+        if groq is not None:
+            await groq.aclose()
+        self.close()
+    
+    def _lazy(self, attr: str, factory):
+        """Return self.<attr>, building it with factory() exactly once"""
+        value = getattr(self, attr, None)
+        if value is None:
+            with self._init_lock:
+                value = getattr(self, attr, None)
+                if value is None:
+                    value = factory()
+                    setattr(self, attr, value)
+        return value
+    
+    @property
+    def http(self):
+        # One keep-alive pool for the orchestrator's sync Groq traffic
+        return self._lazy('_http', lambda: httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=32)
+        ))
+    
+    @property
+    def groq(self):
+        return self._lazy('_groq', lambda: GroqClient(http_client=self.http))
+    
+    @property
+    def linkup(self):
+        return self._lazy('_linkup', LinkupWrapper)
+    
+    # TODO: Add specific agents as lazy properties
+    # @property
+    # def email_agent(self):
+    #     return self._lazy('_email_agent', lambda: EmailAgent(self.groq, self.linkup))
+    
+    def process(self, scenario: str, input_data: dict, use_cache: bool = True) -> dict:
         """
         Main entry point for all agent requests
         
         Args:
             scenario: One of 'email', 'document', 'meeting'
             input_data: Dict with scenario-specific data
+            use_cache: False skips the cache lookup (e.g. "regenerate"); the
+                fresh result still replaces the cached one
         
         Returns:
             {
@@ -38,29 +124,85 @@ class AgentOrchestrator:
                 'execution_time': 5.2      # Seconds taken
             }
         """
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        cache_key = self._cache_key(scenario, input_data)
+        cached = self._cache.get(cache_key) if use_cache and cache_key is not None else None
+        if cached is not None:
+            result = copy.deepcopy(cached)
+            result['cache_hit'] = True
+            result['execution_time'] = round(time.perf_counter() - start_time, 2)
+            return result
         
         try:
-            if scenario == "email":
-                result = self._process_email(input_data)
-            elif scenario == "document":
-                result = self._process_document(input_data)
-            elif scenario == "meeting":
-                result = self._process_meeting(input_data)
-            else:
+            handler = self._handlers.get(scenario)
+            if handler is None:
                 raise ValueError(f"Unknown scenario: {scenario}")
             
-            result['execution_time'] = round(time.time() - start_time, 2)
+            result = handler(input_data)
+            result['execution_time'] = round(time.perf_counter() - start_time, 2)
+            result['cache_hit'] = False
+            if cache_key is not None:
+                self._cache.set(cache_key, copy.deepcopy(result))
             return result
         
         except Exception as e:
-            return {
-                'error': str(e),
-                'reasoning_steps': [f"Error occurred: {str(e)}"],
-                'linkup_sources': [],
-                'result': None
-            }
+            return self._error_result(str(e))
+    
+    def clear_cache(self):
+        """Forget cached process() results, e.g. on an explicit user refresh"""
+        self._cache.clear()
+    
+    @staticmethod
+    def _error_result(message: str) -> dict:
+        """Build the result dict returned when a scenario fails"""
+        return {
+            'error': message,
+            'reasoning_steps': [f"Error occurred: {message}"],
+            'linkup_sources': [],
+            'result': None
+        }
+    
+    @staticmethod
+    def _cache_key(scenario: str, input_data: dict):
+        """
+        Hash scenario + canonicalized input_data into a result cache key
+        
+        When input_data points at a file (e.g. the document scenario's
+        'file_path'), its mtime and size are part of the key so an edited
+        file is re-analyzed instead of served from cache.
+        
+        Returns None when the input cannot be keyed (e.g. non-string dict
+        keys); process() then runs the scenario without caching.
+        """
+        file_state = None
+        file_path = input_data.get('file_path') if isinstance(input_data, dict) else None
+        if isinstance(file_path, (str, os.PathLike)) and file_path:
+            try:
+                stat = os.stat(file_path)
+                file_state = [stat.st_mtime_ns, stat.st_size]
+            except (OSError, ValueError):
+                pass
+        
+        try:
+            payload = json.dumps(
+                {"s": scenario, "i": input_data, "f": file_state},
+                sort_keys=True,
+                default=str
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    async def aprocess(self, scenario: str, input_data: dict, use_cache: bool = True) -> dict:
+        """
+        Async version of process() for use inside an event loop
+        
+        The scenario handlers are synchronous, so the work runs in a worker
+        thread; several scenarios can be awaited together with asyncio.gather.
+        Returns the same dict as process().
+        """
+        return await asyncio.to_thread(self.process, scenario, input_data, use_cache)
     
     def _process_email(self, input_data: dict) -> dict:
         """
@@ -128,15 +270,14 @@ class AgentOrchestrator:
         }
 
 
-# Quick test
+# Quick test (run with: python -m src.agents.orchestrator)
 if __name__ == "__main__":
-    orchestrator = AgentOrchestrator()
-    
-    # Test email scenario
-    result = orchestrator.process(
-        scenario="email",
-        input_data={"email_content": "Test email from Acme Corp"}
-    )
+    with AgentOrchestrator() as orchestrator:
+        # Test email scenario
+        result = orchestrator.process(
+            scenario="email",
+            input_data={"email_content": "Test email from Acme Corp"}
+        )
     
     print(f"Result: {result}")
     print(f"Execution time: {result['execution_time']}s")